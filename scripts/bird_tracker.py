@@ -17,27 +17,193 @@ import json
 import argparse
 import sys
 import os
+import multiprocessing
+import queue
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
 
 from detector import BirdDetector
 from tracker import CentroidTracker
 
+# Use orjson for IPC serialization when available (C-accelerated); fall back
+# to compact stdlib json
+try:
+    import orjson
+
+    def _json_dumps_bytes(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_dumps_bytes(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+class IpcWriter:
+    """
+    Length-prefixed binary JSON framing over stdout for IPC mode.
+
+    Each message is serialized to JSON bytes and written as a 4-byte
+    little-endian length followed by the payload. Frame messages are buffered
+    and flushed every FLUSH_INTERVAL messages or FLUSH_BYTES bytes, so the
+    60 fps stream does not pay a stdout flush per frame; control messages
+    are flushed immediately.
+    """
+
+    FLUSH_INTERVAL = 10
+    FLUSH_BYTES = 64 * 1024
+
+    def __init__(self, stream=None):
+        self._stream = stream if stream is not None else sys.stdout.buffer
+        self._pending_messages = 0
+        self._pending_bytes = 0
+
+    def write(self, message: Dict, flush: bool = False):
+        """
+        Serialize and frame a message, flushing per the buffering policy.
+
+        Args:
+            message: JSON-serializable message dictionary
+            flush: Force an immediate flush (for control messages)
+        """
+        payload = _json_dumps_bytes(message)
+        self._stream.write(len(payload).to_bytes(4, 'little'))
+        self._stream.write(payload)
+        self._pending_messages += 1
+        self._pending_bytes += len(payload) + 4
+
+        if (flush or self._pending_messages >= self.FLUSH_INTERVAL
+                or self._pending_bytes >= self.FLUSH_BYTES):
+            self.flush()
+
+    def flush(self):
+        """
+        Flush any buffered frames to the underlying stream.
+        """
+        self._stream.flush()
+        self._pending_messages = 0
+        self._pending_bytes = 0
+
+
+@dataclass
+class VideoInfo:
+    """
+    Static properties of an opened video stream, probed once per run.
+    """
+
+    fps: int
+    width: int
+    height: int
+    total_frames: int
+
+    @classmethod
+    def probe(cls, cap: cv2.VideoCapture) -> 'VideoInfo':
+        """
+        Query the capture properties in one place.
+
+        Args:
+            cap: Opened video capture
+
+        Returns:
+            VideoInfo with fps, dimensions, and frame count
+        """
+        return cls(
+            fps=int(cap.get(cv2.CAP_PROP_FPS)),
+            width=int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            height=int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            total_frames=int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        )
+
+
+class FFmpegVideoWriter:
+    """
+    cv2.VideoWriter-compatible writer that pipes raw BGR frames to an ffmpeg
+    subprocess (libx264, ultrafast preset).
+
+    Encoding runs in a separate OS process with its own thread pool, so the
+    Python process never blocks on codec work; libx264 also reliably outpaces
+    OpenCV's single-threaded mp4v on long runs.
+    """
+
+    def __init__(self, output_path: str, fps: float, frame_size: Tuple[int, int]):
+        """
+        Spawn the ffmpeg encoder process.
+
+        Args:
+            output_path: Path to the output video file
+            fps: Output frame rate
+            frame_size: (width, height) of the frames to encode
+        """
+        width, height = frame_size
+        command = [
+            'ffmpeg', '-y', '-loglevel', 'error',
+            '-f', 'rawvideo', '-pix_fmt', 'bgr24',
+            '-s', f'{width}x{height}', '-r', str(fps),
+            '-i', '-',
+            '-an', '-c:v', 'libx264', '-preset', 'ultrafast',
+            '-pix_fmt', 'yuv420p',
+            output_path
+        ]
+        self._proc = subprocess.Popen(command, stdin=subprocess.PIPE)
+
+    def write(self, frame: np.ndarray):
+        """
+        Send one BGR frame to the encoder.
+
+        Args:
+            frame: Frame to encode (must match the configured frame size)
+        """
+        self._proc.stdin.write(frame.tobytes())
+
+    def release(self):
+        """
+        Close the pipe and wait for the encoder to finish the file.
+
+        Raises:
+            IOError: If ffmpeg exited with a nonzero status (failed encode)
+        """
+        try:
+            self._proc.stdin.close()
+        except BrokenPipeError:
+            # Encoder already died; the exit status below reports it
+            pass
+        returncode = self._proc.wait()
+        if returncode != 0:
+            raise IOError(f"ffmpeg exited with status {returncode}")
+
+    @staticmethod
+    def is_available() -> bool:
+        """
+        Check whether an ffmpeg binary is on PATH.
+
+        Returns:
+            True if ffmpeg can be spawned
+        """
+        return shutil.which('ffmpeg') is not None
+
 
 class BirdTrackingSystem:
     """
     Complete bird tracking system integrating detection and tracking.
     """
 
-    def __init__(self, config_path: str = "config.json"):
+    def __init__(self, config_path: str = "config.json", num_threads: Optional[int] = None):
         """
         Initialize bird tracking system.
 
         Args:
             config_path: Path to configuration JSON file
+            num_threads: Optional OpenCV thread budget for this pipeline;
+                         batch workers cap it so parallel pipelines share
+                         the machine. None means use all cores.
         """
         # Load configuration
         self.config = self._load_config(config_path)
+        if num_threads is not None:
+            self.config.setdefault('performance', {})['num_threads'] = num_threads
 
         # Initialize detector and tracker
         self.detector = BirdDetector(self.config)
@@ -51,9 +217,18 @@ class BirdTrackingSystem:
         self.vis_config = self.config['visualization']
         self.output_config = self.config['output']
 
+        # Performance config (optional section)
+        self.performance_config = self.config.get('performance', {})
+        self.prefetch_frames = self.performance_config.get('prefetch_frames', 8)
+
         # Selected bird for console output (IPC mode)
         self.selected_bird_id = None
 
+        # Cached per-zone blend data for the exclusion-zone overlay
+        # (built on first use for a given frame size)
+        self._zone_draw_cache = None
+        self._zone_draw_shape = None
+
     def _load_config(self, config_path: str) -> dict:
         """
         Load configuration from JSON file.
@@ -72,6 +247,87 @@ class BirdTrackingSystem:
         with open(config_full_path, 'r') as f:
             return json.load(f)
 
+    def _start_reader_thread(self, cap: cv2.VideoCapture, stop_event: threading.Event) -> Tuple[queue.Queue, threading.Thread]:
+        """
+        Start a background thread that decodes frames into a bounded queue.
+
+        Decode runs concurrently with detection/tracking so the main loop never
+        stalls on disk I/O or codec work. The queue carries (ret, frame) pairs;
+        a (False, None) entry marks end of stream.
+
+        Args:
+            cap: Opened video capture to read from
+            stop_event: Event used to abort decoding early
+
+        Returns:
+            Tuple of (frame queue, reader thread)
+        """
+        read_q = queue.Queue(maxsize=self.prefetch_frames)
+
+        def _reader():
+            while not stop_event.is_set():
+                ret, frame = cap.read()
+                read_q.put((ret, frame))
+                if not ret:
+                    break
+
+        thread = threading.Thread(target=_reader, daemon=True)
+        thread.start()
+        return read_q, thread
+
+    def _start_writer_thread(self, writer: cv2.VideoWriter) -> Tuple[queue.Queue, threading.Thread, List[Exception]]:
+        """
+        Start a background thread that encodes frames from a bounded queue.
+
+        Encoding runs concurrently with detection/tracking; a None entry on the
+        queue signals the thread to finish. If a write fails (e.g. the ffmpeg
+        process dies), the exception lands in the returned error holder and the
+        thread keeps draining the queue, so the producer's bounded put() never
+        deadlocks against a dead consumer.
+
+        Args:
+            writer: Opened video writer to write to
+
+        Returns:
+            Tuple of (frame queue, writer thread, error holder); the holder is
+            non-empty once a write has failed
+        """
+        write_q = queue.Queue(maxsize=self.prefetch_frames)
+        write_error: List[Exception] = []
+
+        def _writer():
+            while True:
+                frame = write_q.get()
+                if frame is None:
+                    break
+                if write_error:
+                    # Already failed: discard frames instead of dying, so
+                    # the main loop stays unblocked until it sees the error
+                    continue
+                try:
+                    writer.write(frame)
+                except Exception as exc:
+                    write_error.append(exc)
+
+        thread = threading.Thread(target=_writer, daemon=True)
+        thread.start()
+        return write_q, thread, write_error
+
+    @staticmethod
+    def _drain_reader(read_q: queue.Queue, reader_thread: threading.Thread):
+        """
+        Unblock and join a reader thread after an early exit.
+
+        Args:
+            read_q: Frame queue the reader may be blocked on
+            reader_thread: Reader thread to join
+        """
+        while reader_thread.is_alive():
+            try:
+                read_q.get_nowait()
+            except queue.Empty:
+                reader_thread.join(timeout=0.01)
+
     def process_video_stream(self, input_path: str, frame_callback=None) -> Dict:
         """
         Process video frame-by-frame and stream tracking data (for Electron integration).
@@ -90,26 +346,27 @@ class BirdTrackingSystem:
             raise IOError(f"Cannot open video file: {input_path}")
 
         # Get video properties
-        fps = int(cap.get(cv2.CAP_PROP_FPS))
-        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        info = VideoInfo.probe(cap)
 
         # Processing loop
         frame_num = 0
         processing_stats = {
-            'total_frames': total_frames,
+            'total_frames': info.total_frames,
             'processed_frames': 0,
             'max_simultaneous_birds': 0,
             'total_unique_birds': 0,
-            'fps': fps,
-            'width': width,
-            'height': height
+            'fps': info.fps,
+            'width': info.width,
+            'height': info.height
         }
 
+        # Decode frames on a background thread so detection overlaps I/O
+        stop_event = threading.Event()
+        read_q, reader_thread = self._start_reader_thread(cap, stop_event)
+
         try:
             while True:
-                ret, frame = cap.read()
+                ret, frame = read_q.get()
 
                 if not ret:
                     break
@@ -151,7 +408,8 @@ class BirdTrackingSystem:
                     # Find corresponding bounding box using detection index
                     detection_idx = detection_indices.get(object_id)
                     if detection_idx is not None and detection_idx < len(bounding_boxes):
-                        x, y, w, h = bounding_boxes[detection_idx]
+                        # tolist() yields plain Python ints for JSON serialization
+                        x, y, w, h = bounding_boxes[detection_idx].tolist()
                         tracking_data['objects'].append({
                             'id': object_id,
                             'x': x,
@@ -167,6 +425,8 @@ class BirdTrackingSystem:
                     frame_callback(frame_num, tracking_data)
 
         finally:
+            stop_event.set()
+            self._drain_reader(read_q, reader_thread)
             cap.release()
 
         return processing_stats
@@ -191,38 +451,76 @@ class BirdTrackingSystem:
             raise IOError(f"Cannot open video file: {input_path}")
 
         # Get video properties
-        fps = int(cap.get(cv2.CAP_PROP_FPS))
-        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        info = VideoInfo.probe(cap)
 
         # Initialize video writer if saving output
         writer = None
         if output_path and self.output_config['save_video']:
-            fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-            writer = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
+            encoder = self.output_config.get('encoder', 'opencv')
+            if encoder == 'ffmpeg' and FFmpegVideoWriter.is_available():
+                writer = FFmpegVideoWriter(output_path, info.fps, (info.width, info.height))
+            else:
+                if encoder == 'ffmpeg':
+                    print("WARNING: ffmpeg not found on PATH, falling back to OpenCV VideoWriter",
+                          file=sys.stderr)
+                fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+                writer = cv2.VideoWriter(output_path, fourcc, info.fps, (info.width, info.height))
 
         # Processing loop
         frame_num = 0
         processing_stats = {
-            'total_frames': total_frames,
+            'total_frames': info.total_frames,
             'processed_frames': 0,
             'max_simultaneous_birds': 0,
             'total_unique_birds': 0
         }
 
+        # Three-stage pipeline: reader thread -> detect/track/visualize on the
+        # main thread -> writer thread. Tracker state stays on the main thread
+        # so no locking is needed.
+        stop_event = threading.Event()
+        read_q, reader_thread = self._start_reader_thread(cap, stop_event)
+
+        write_q = None
+        writer_thread = None
+        write_error: List[Exception] = []
+        if writer is not None:
+            write_q, writer_thread, write_error = self._start_writer_thread(writer)
+
+        # Detection for frame N+1 runs on a worker thread while the main
+        # thread tracks and annotates frame N; OpenCV releases the GIL during
+        # its C calls, so the two genuinely overlap. A single worker keeps
+        # the stateful MOG2 updates in frame order.
+        detect_pool = ThreadPoolExecutor(max_workers=1)
+        current = None  # (frame, detection future) awaiting tracking
+        eof = False
+
         try:
             while True:
-                ret, frame = cap.read()
-
-                if not ret:
-                    break
+                if current is None:
+                    if eof:
+                        break
+                    ret, frame = read_q.get()
+                    if not ret:
+                        break
+                    current = (frame, detect_pool.submit(self.detector.detect, frame))
+
+                # Queue detection of the next frame before doing the
+                # Python-side work for this one
+                nxt = None
+                if not eof:
+                    ret, next_frame = read_q.get()
+                    if ret:
+                        nxt = (next_frame, detect_pool.submit(self.detector.detect, next_frame))
+                    else:
+                        eof = True
+
+                frame, detect_future = current
+                bounding_boxes, mask = detect_future.result()
+                current = nxt
 
                 frame_num += 1
 
-                # Detect birds in current frame
-                bounding_boxes, mask = self.detector.detect(frame)
-
                 # Get centroids from bounding boxes
                 centroids = self.detector.get_centroids(bounding_boxes)
 
@@ -249,39 +547,61 @@ class BirdTrackingSystem:
                     if cv2.waitKey(1) & 0xFF == ord('q'):
                         break
 
-                # Write frame if saving
-                if writer is not None:
-                    writer.write(annotated_frame)
+                # Queue frame for the writer thread if saving; surface a
+                # writer failure here instead of blocking on a dead consumer
+                if write_q is not None:
+                    if write_error:
+                        raise IOError(
+                            f"Video writer failed: {write_error[0]}"
+                        ) from write_error[0]
+                    write_q.put(annotated_frame)
 
                 # Progress callback
                 if progress_callback:
                     progress_callback(frame_num, stats)
 
         finally:
-            # Cleanup
+            # Cleanup: unblock the reader, flush the writer queue, then release
+            stop_event.set()
+            self._drain_reader(read_q, reader_thread)
+            detect_pool.shutdown(wait=True)
             cap.release()
+            if write_q is not None:
+                write_q.put(None)
+                writer_thread.join()
             if writer is not None:
-                writer.release()
+                try:
+                    writer.release()
+                except IOError as exc:
+                    # Record rather than raise: an error already propagating
+                    # out of the loop must not be masked here
+                    write_error.append(exc)
             if self.output_config['show_display']:
                 cv2.destroyAllWindows()
 
+        if write_error:
+            raise IOError(f"Video writer failed: {write_error[0]}") from write_error[0]
+
         return processing_stats
 
     def _visualize(self, frame: np.ndarray, objects: Dict[int, np.ndarray],
-                   bounding_boxes: List[Tuple[int, int, int, int]],
+                   bounding_boxes: np.ndarray,
                    detection_indices: Dict[int, int]) -> np.ndarray:
         """
         Draw bounding boxes, IDs, and statistics on frame.
 
         Args:
-            frame: Input frame
+            frame: Input frame; annotated in place (the caller does not reuse
+                   the un-annotated frame)
             objects: Dictionary of tracked objects {id: centroid}
-            bounding_boxes: List of bounding boxes
+            bounding_boxes: int32 array of shape (N, 4) with (x, y, w, h) rows
 
         Returns:
-            Annotated frame
+            Annotated frame (same buffer as the input frame)
         """
-        annotated = frame.copy()
+        # Draw directly onto the source frame: copying a 1080p BGR frame is a
+        # ~6 MB memcpy per frame and the caller only uses the annotated result
+        annotated = frame
 
         # Draw each tracked object using detection indices
         for object_id, centroid in objects.items():
@@ -290,7 +610,7 @@ class BirdTrackingSystem:
             # Find corresponding bounding box using detection index
             detection_idx = detection_indices.get(object_id)
             if detection_idx is not None and detection_idx < len(bounding_boxes):
-                x, y, w, h = bounding_boxes[detection_idx]
+                x, y, w, h = bounding_boxes[detection_idx].tolist()
 
                 # Draw bounding box
                 color = tuple(self.vis_config['box_color'])
@@ -319,9 +639,8 @@ class BirdTrackingSystem:
 
             # Draw trajectory if enabled
             if self.vis_config['show_trails']:
-                trajectory = self.tracker.get_trajectory(object_id)
-                if len(trajectory) > 1:
-                    pts = np.array(trajectory, dtype=np.int32)
+                pts = self.tracker.get_trajectory_array(object_id)
+                if len(pts) > 1:
                     cv2.polylines(annotated, [pts], False, (255, 0, 0), 2)
 
         # Draw exclusion zones if debug mode enabled
@@ -356,6 +675,47 @@ class BirdTrackingSystem:
         cv2.putText(frame, f"Total Birds Detected: {stats['total_birds_seen']}",
                    (20, 75), font, font_scale, color, thickness)
 
+    def _get_zone_draw_cache(self, shape: Tuple[int, ...]) -> List[Tuple[int, int, int, int, np.ndarray]]:
+        """
+        Get cached per-zone blend data for the given frame shape.
+
+        Zones are static for the whole video, so the clipped zone rectangles
+        and the solid red tiles blended into them are built once and reused.
+
+        Args:
+            shape: Shape of the frames being annotated
+
+        Returns:
+            List of (x, y, width, height, red_tile) entries
+        """
+        if self._zone_draw_cache is None or self._zone_draw_shape != shape:
+            frame_height, frame_width = shape[:2]
+            cache = []
+
+            for zone in self.detector.exclusion_zones:
+                x = zone.get('x', 0)
+                y = zone.get('y', 0)
+                width = zone.get('width', 0)
+                height = zone.get('height', 0)
+
+                # Clip to the frame so the blended ROI is always valid
+                x0 = max(0, min(x, frame_width))
+                y0 = max(0, min(y, frame_height))
+                clipped_w = min(width, frame_width - x0)
+                clipped_h = min(height, frame_height - y0)
+
+                if clipped_w <= 0 or clipped_h <= 0:
+                    continue
+
+                red_tile = np.zeros((clipped_h, clipped_w, 3), dtype=np.uint8)
+                red_tile[:] = (0, 0, 255)
+                cache.append((x0, y0, clipped_w, clipped_h, red_tile))
+
+            self._zone_draw_cache = cache
+            self._zone_draw_shape = shape
+
+        return self._zone_draw_cache
+
     def _draw_exclusion_zones(self, frame: np.ndarray):
         """
         Draw semi-transparent rectangles over exclusion zones for debugging.
@@ -363,17 +723,12 @@ class BirdTrackingSystem:
         Args:
             frame: Frame to draw on
         """
-        # Create overlay for semi-transparency
-        overlay = frame.copy()
-
-        for zone in self.detector.exclusion_zones:
-            x = zone.get('x', 0)
-            y = zone.get('y', 0)
-            width = zone.get('width', 0)
-            height = zone.get('height', 0)
-
-            # Draw filled rectangle on overlay
-            cv2.rectangle(overlay, (x, y), (x + width, y + height), (0, 0, 255), -1)
+        # Blend only the (static, cached) zone rectangles at 30% opacity;
+        # pixels outside the zones are untouched, so no frame-sized overlay
+        # copy is needed
+        for (x, y, width, height, red_tile) in self._get_zone_draw_cache(frame.shape):
+            roi = frame[y:y + height, x:x + width]
+            cv2.addWeighted(roi, 0.7, red_tile, 0.3, 0, roi)
 
             # Draw border
             cv2.rectangle(frame, (x, y), (x + width, y + height), (0, 0, 255), 2)
@@ -383,8 +738,76 @@ class BirdTrackingSystem:
             cv2.putText(frame, label, (x + 5, y + 20),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 2)
 
-        # Blend overlay with original frame (30% opacity)
-        cv2.addWeighted(overlay, 0.3, frame, 0.7, 0, frame)
+
+def _process_one_video(job: Tuple[str, Optional[str], str, int]) -> Tuple[str, Dict]:
+    """
+    Process a single video in a worker process (batch CLI mode).
+
+    Args:
+        job: Tuple of (input_path, output_path, config_path, num_threads),
+             where num_threads is this worker's OpenCV thread budget
+
+    Returns:
+        Tuple of (input_path, processing statistics)
+    """
+    input_path, output_path, config_path, num_threads = job
+
+    tracker = BirdTrackingSystem(config_path, num_threads=num_threads)
+    # Worker processes cannot open display windows
+    tracker.output_config['show_display'] = False
+
+    results = tracker.process_video(input_path, output_path)
+    return input_path, results
+
+
+def run_batch_mode(args):
+    """
+    Run bird tracker over several input videos in parallel worker processes.
+
+    Each video is an independent, stateful pipeline (MOG2 background model
+    plus tracker IDs), so parallelism is applied per video rather than by
+    splitting a single video.
+
+    Args:
+        args: Command line arguments
+    """
+    workers = args.workers or min(len(args.input), os.cpu_count() or 1)
+
+    # Split the cores across workers: each pipeline already parallelizes
+    # internally via OpenCV threads, so giving every worker all cores
+    # would oversubscribe the CPU workers-fold
+    thread_budget = max(1, (os.cpu_count() or 1) // workers)
+
+    print("=" * 60)
+    print(f"Bird Tracking System - Batch Mode ({workers} workers)")
+    print("=" * 60)
+    for input_path in args.input:
+        print(f"Input:  {input_path}")
+    if args.output:
+        print(f"Output directory: {args.output}")
+    print("=" * 60)
+    print()
+
+    # With multiple inputs, --output names a directory; each video gets
+    # <stem>_tracked.mp4 inside it
+    jobs = []
+    for input_path in args.input:
+        output_path = None
+        if args.output:
+            output_dir = Path(args.output)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            output_path = str(output_dir / f"{Path(input_path).stem}_tracked.mp4")
+        jobs.append((input_path, output_path, args.config, thread_budget))
+
+    try:
+        with multiprocessing.Pool(workers) as pool:
+            for input_path, results in pool.imap_unordered(_process_one_video, jobs):
+                print(f"Completed {input_path}: "
+                      f"frames={results['processed_frames']}, "
+                      f"unique birds={results['total_unique_birds']}")
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
 
 
 def run_cli_mode(args):
@@ -394,10 +817,16 @@ def run_cli_mode(args):
     Args:
         args: Command line arguments
     """
+    if len(args.input) > 1:
+        run_batch_mode(args)
+        return
+
+    input_path = args.input[0]
+
     print("=" * 60)
     print("Bird Tracking System - CLI Mode")
     print("=" * 60)
-    print(f"Input:  {args.input}")
+    print(f"Input:  {input_path}")
     if args.output:
         print(f"Output: {args.output}")
     print("=" * 60)
@@ -416,7 +845,7 @@ def run_cli_mode(args):
     # Process video
     try:
         results = tracker.process_video(
-            args.input,
+            input_path,
             args.output,
             progress_callback=progress_callback
         )
@@ -445,14 +874,14 @@ def run_ipc_mode(args):
         args: Command line arguments
     """
     tracker = BirdTrackingSystem(args.config)
+    writer = IpcWriter()
 
-    # Frame callback that outputs tracking data to stdout
+    # Frame callback that streams tracking data to stdout (buffered framing)
     def frame_callback(frame_num, tracking_data):
-        output = {
+        writer.write({
             'type': 'frame_data',
             'data': tracking_data
-        }
-        print(json.dumps(output), flush=True)
+        })
 
     # Listen for commands from stdin
     for line in sys.stdin:
@@ -463,20 +892,18 @@ def run_ipc_mode(args):
                 input_path = command['input']
 
                 # Start processing in streaming mode
-                output = {'type': 'started'}
-                print(json.dumps(output), flush=True)
+                writer.write({'type': 'started'}, flush=True)
 
                 results = tracker.process_video_stream(
                     input_path,
                     frame_callback=frame_callback
                 )
 
-                # Send completion message
-                output = {
+                # Send completion message (flushes any buffered frames first)
+                writer.write({
                     'type': 'completed',
                     'results': results
-                }
-                print(json.dumps(output), flush=True)
+                }, flush=True)
 
             elif command['action'] == 'set_selected_bird':
                 # Update selected bird ID
@@ -485,16 +912,14 @@ def run_ipc_mode(args):
 
             elif command['action'] == 'stop':
                 # Stop processing (would need threading for proper implementation)
-                output = {'type': 'stopped'}
-                print(json.dumps(output), flush=True)
+                writer.write({'type': 'stopped'}, flush=True)
                 break
 
         except Exception as e:
-            error_output = {
+            writer.write({
                 'type': 'error',
                 'message': str(e)
-            }
-            print(json.dumps(error_output), flush=True)
+            }, flush=True)
 
 
 def main():
@@ -508,13 +933,21 @@ def main():
     parser.add_argument(
         '--input', '-i',
         type=str,
-        help='Input video file path'
+        nargs='+',
+        help='Input video file path(s); multiple paths run in parallel worker processes'
     )
 
     parser.add_argument(
         '--output', '-o',
         type=str,
-        help='Output video file path (optional)'
+        help='Output video file path (or output directory with multiple inputs)'
+    )
+
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=None,
+        help='Worker processes for batch mode (default: one per input, capped at CPU count)'
     )
 
     parser.add_argument(
@@ -4,6 +4,25 @@ Test script to verify bird tracking system installation.
 """
 
 import sys
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def _load_config(path):
+    """
+    Read and parse the config file once, shared by every test that
+    needs it. Uses orjson when installed (same optional speedup the
+    tracker uses), falling back to the stdlib parser.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    try:
+        import orjson
+        return orjson.loads(data)
+    except ImportError:
+        import json
+        return json.loads(data)
+
 
 def test_imports():
     """Test if all required modules can be imported."""
@@ -58,7 +77,6 @@ def test_config():
     """Test if config file exists and is valid JSON."""
     print("\nTesting configuration...")
 
-    import json
     from pathlib import Path
 
     config_path = Path(__file__).parent / 'config.json'
@@ -70,8 +88,7 @@ def test_config():
     print("✓ config.json exists")
 
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        config = _load_config(str(config_path))
         print("✓ config.json is valid JSON")
 
         # Check required sections
@@ -84,7 +101,7 @@ def test_config():
                 return False
 
         return True
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         print("✗ config.json is invalid: {}".format(e))
         return False
 
@@ -103,6 +120,10 @@ def test_video_file():
         # Check if OpenCV can open it
         import cv2
         cap = cv2.VideoCapture(str(video_path))
+        # Keep the capture buffer at a single frame: irrelevant for a
+        # file on disk, but avoids multi-frame buffering latency if the
+        # source is ever swapped for a live camera
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
         if cap.isOpened():
             width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
@@ -115,6 +136,28 @@ def test_video_file():
             print("  FPS: {}".format(fps))
             print("  Total Frames: {}".format(frame_count))
 
+            # Probe a few frames with grab(), which advances the demuxer
+            # without paying for a decode, then decode only the last one
+            # with retrieve() to confirm the stream is actually readable
+            grabbed = 0
+            for _ in range(5):
+                if not cap.grab():
+                    break
+                grabbed += 1
+
+            if grabbed == 0:
+                print("✗ Video opens but no frames can be read")
+                cap.release()
+                return False
+
+            ret, _ = cap.retrieve()
+            if not ret:
+                print("✗ Frames demux but do not decode")
+                cap.release()
+                return False
+
+            print("✓ Probed {} frames (decoded 1)".format(grabbed))
+
             cap.release()
             return True
         else:
@@ -131,13 +174,11 @@ def test_detector_initialization():
     print("\nTesting detector initialization...")
 
     try:
-        import json
         from pathlib import Path
         from detector import BirdDetector
 
         config_path = Path(__file__).parent / 'config.json'
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        config = _load_config(str(config_path))
 
         detector = BirdDetector(config)
         print("✓ BirdDetector initialized successfully")
@@ -162,24 +203,55 @@ def test_tracker_initialization():
         return False
 
 
+# (name, test function, third-party modules it will import)
+TESTS = [
+    ('imports', test_imports, ()),
+    ('local-modules', test_local_modules, ('cv2', 'numpy', 'scipy')),
+    ('config', test_config, ()),
+    ('video', test_video_file, ('cv2',)),
+    ('detector', test_detector_initialization, ('cv2', 'numpy')),
+    ('tracker', test_tracker_initialization, ('numpy',)),
+]
+
+
+def _missing_requirements(modules):
+    """
+    Return the subset of modules that are not installed.
+
+    Uses importlib.util.find_spec, which only consults the import system
+    metadata — nothing gets loaded, so the check costs microseconds even
+    for heavy packages like OpenCV or SciPy.
+    """
+    import importlib.util
+    return [m for m in modules if importlib.util.find_spec(m) is None]
+
+
 def main():
-    """Run all tests."""
+    """Run all tests, or a subset selected with --only."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Bird tracking installation test')
+    parser.add_argument('--only', nargs='+', choices=[name for name, _, _ in TESTS],
+                        help='Run only the named tests (e.g. --only config tracker)')
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Bird Tracking System - Installation Test")
     print("=" * 60)
     print()
 
-    tests = [
-        test_imports,
-        test_local_modules,
-        test_config,
-        test_video_file,
-        test_detector_initialization,
-        test_tracker_initialization
-    ]
+    selected = [t for t in TESTS if args.only is None or t[0] in args.only]
 
     results = []
-    for test in tests:
+    for name, test, requires in selected:
+        missing = _missing_requirements(requires)
+        if missing:
+            # Don't pay for an import that is known to fail; report the
+            # gap without the traceback noise
+            print("✗ Test '{}' skipped: missing module(s): {}".format(name, ', '.join(missing)))
+            results.append(False)
+            print()
+            continue
         try:
             result = test()
             results.append(result)
@@ -194,6 +266,8 @@ def main():
 
     if all(results):
         print("\n✓ All tests passed! System is ready to use.")
+        if args.only:
+            return 0
         print("\nNext steps:")
         print("  1. Run: python bird_tracker.py --input ../birdsExample.mp4")
         print("  2. See BIRD_TRACKING_QUICKSTART.md for usage guide")
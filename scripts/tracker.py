@@ -3,11 +3,115 @@ Bird Tracking Module
 Implements centroid-based tracking with Hungarian algorithm for optimal ID assignment.
 """
 
+import math
+
 import numpy as np
-from scipy.optimize import linear_sum_assignment
-from collections import OrderedDict, deque
 from typing import Dict, List, Tuple, Optional
 
+# SciPy costs ~300ms to import, so it is loaded lazily on first use:
+# importing this module (installation checks, tooling) stays cheap and
+# only callers that actually match detections pay for the solver
+_linear_sum_assignment = None
+_cdist = None
+
+
+def _load_scipy():
+    """Bind the SciPy solver and distance functions on first use."""
+    global _linear_sum_assignment, _cdist
+    from scipy.optimize import linear_sum_assignment
+    from scipy.spatial.distance import cdist
+    _linear_sum_assignment = linear_sum_assignment
+    _cdist = cdist
+
+
+class _CentroidStore:
+    """
+    Contiguous (N, 2) centroid storage addressed by stable object IDs.
+
+    Rows stay densely packed via swap-with-last removal, so the live
+    centroids are always available as one contiguous array view and never
+    need rebuilding from a dict each frame. Row order is arbitrary after
+    removals; `ids` gives the ID for each row.
+    """
+
+    def __init__(self, capacity: int = 16):
+        self._array = np.empty((capacity, 2), dtype=np.float64)
+        self._ids = []   # row -> object ID
+        self._rows = {}  # object ID -> row
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def ids(self) -> List[int]:
+        """Object IDs in row order (live list; snapshot before mutating)."""
+        return self._ids
+
+    def view(self) -> np.ndarray:
+        """Contiguous (len, 2) float64 view of the live centroids."""
+        return self._array[:len(self._ids)]
+
+    def add(self, obj_id: int, centroid: np.ndarray):
+        """Append a centroid for a new object, growing capacity as needed."""
+        row = len(self._ids)
+        if row == len(self._array):
+            self._array = np.resize(self._array, (2 * len(self._array), 2))
+        self._array[row] = centroid
+        self._ids.append(obj_id)
+        self._rows[obj_id] = row
+
+    def set(self, obj_id: int, centroid: np.ndarray):
+        """Overwrite the centroid of an existing object in place."""
+        self._array[self._rows[obj_id]] = centroid
+
+    def remove(self, obj_id: int):
+        """Remove an object, swapping the last row into its slot."""
+        row = self._rows.pop(obj_id)
+        last = len(self._ids) - 1
+        last_id = self._ids.pop()
+        if row != last:
+            self._array[row] = self._array[last]
+            self._ids[row] = last_id
+            self._rows[last_id] = row
+
+    def clear(self):
+        """Drop all stored centroids."""
+        self._ids.clear()
+        self._rows.clear()
+
+
+class _RingTrail:
+    """
+    Fixed-capacity trajectory storage backed by a preallocated array.
+
+    Replaces a deque of Python tuples: appends write into a (capacity, 2)
+    float32 ring buffer with no per-point object allocation, and reads
+    come back as one chronological ndarray instead of a tuple list.
+    """
+
+    __slots__ = ('_buf', '_head', '_len')
+
+    def __init__(self, capacity: int):
+        self._buf = np.empty((capacity, 2), dtype=np.float32)
+        self._head = 0
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def append(self, point):
+        """Append an (x, y) point, overwriting the oldest when full."""
+        self._buf[self._head] = point
+        self._head = (self._head + 1) % len(self._buf)
+        if self._len < len(self._buf):
+            self._len += 1
+
+    def points(self) -> np.ndarray:
+        """Stored points in chronological order as a (len, 2) array."""
+        if self._len < len(self._buf):
+            return self._buf[:self._len]
+        return np.roll(self._buf, -self._head, axis=0)
+
 
 class CentroidTracker:
     """
@@ -25,8 +129,13 @@ class CentroidTracker:
             config: Optional configuration dictionary for temporal filtering
         """
         self.next_object_id = 0
-        self.objects = OrderedDict()  # {object_id: (cx, cy)}
-        self.disappeared = OrderedDict()  # {object_id: disappeared_count}
+        self.objects = {}  # {object_id: (cx, cy)}
+        self.disappeared = {}  # {object_id: disappeared_count}
+
+        # Contiguous SoA mirrors of the centroid dicts, fed straight into
+        # the distance computation without per-frame rebuilds
+        self._object_store = _CentroidStore()
+        self._probationary_store = _CentroidStore()
         self.max_disappeared = max_disappeared
         self.max_distance = max_distance
 
@@ -42,17 +151,26 @@ class CentroidTracker:
 
         # Probationary tracking for temporal filtering
         self.next_probationary_id = 0
-        self.probationary = OrderedDict()  # {prob_id: (cx, cy)} - current position
-        self.probationary_initial = OrderedDict()  # {prob_id: (cx, cy)} - initial position
-        self.probationary_frames = OrderedDict()  # {prob_id: frame_count}
-        self.probationary_disappeared = OrderedDict()  # {prob_id: disappeared_count}
-        self.probationary_trajectories = OrderedDict()  # {prob_id: deque(positions)} - for cumulative path
+        self.probationary = {}  # {prob_id: (cx, cy)} - current position
+        self.probationary_initial = {}  # {prob_id: (cx, cy)} - initial position
+        self.probationary_frames = {}  # {prob_id: frame_count}
+        self.probationary_disappeared = {}  # {prob_id: disappeared_count}
+        self.probationary_cumulative = {}  # {prob_id: path length so far}
         self.probationary_max_disappeared = 5  # Fast cleanup for probationary objects
 
         # For trajectory visualization
-        self.trajectories = {}  # {object_id: deque([(cx, cy), ...])}
+        self.trajectories = {}  # {object_id: _RingTrail}
         self.max_trail_length = 30
 
+        # Cached ndarray views of trajectories for drawing; entries are
+        # rebuilt lazily only for objects whose trail changed this frame
+        self._trajectory_arrays = {}  # {object_id: np.ndarray}
+        self._trajectory_dirty = set()
+
+        # Reused buffer for IDs to deregister, so the disappearance
+        # sweeps never snapshot whole key lists just to mutate safely
+        self._scratch_remove_ids = []
+
         # Statistics
         self.total_birds_seen = 0
 
@@ -68,9 +186,11 @@ class CentroidTracker:
         """
         object_id = self.next_object_id
         self.objects[object_id] = centroid
+        self._object_store.add(object_id, centroid)
         self.disappeared[object_id] = 0
-        self.trajectories[object_id] = deque(maxlen=self.max_trail_length)
-        self.trajectories[object_id].append(tuple(centroid))
+        self.trajectories[object_id] = _RingTrail(self.max_trail_length)
+        self.trajectories[object_id].append(centroid)
+        self._trajectory_dirty.add(object_id)
         self.next_object_id += 1
         self.total_birds_seen += 1
         return object_id
@@ -83,9 +203,12 @@ class CentroidTracker:
             object_id: ID of object to remove
         """
         del self.objects[object_id]
+        self._object_store.remove(object_id)
         del self.disappeared[object_id]
         if object_id in self.trajectories:
             del self.trajectories[object_id]
+        self._trajectory_arrays.pop(object_id, None)
+        self._trajectory_dirty.discard(object_id)
 
     def register_probationary(self, centroid: np.ndarray) -> int:
         """
@@ -99,10 +222,11 @@ class CentroidTracker:
         """
         prob_id = self.next_probationary_id
         self.probationary[prob_id] = centroid
+        self._probationary_store.add(prob_id, centroid)
         self.probationary_initial[prob_id] = centroid.copy()
         self.probationary_frames[prob_id] = 1
         self.probationary_disappeared[prob_id] = 0
-        self.probationary_trajectories[prob_id] = deque([tuple(centroid)], maxlen=self.min_confirm_frames)
+        self.probationary_cumulative[prob_id] = 0.0
         self.next_probationary_id += 1
         return prob_id
 
@@ -115,10 +239,11 @@ class CentroidTracker:
         """
         if prob_id in self.probationary:
             del self.probationary[prob_id]
+            self._probationary_store.remove(prob_id)
             del self.probationary_initial[prob_id]
             del self.probationary_frames[prob_id]
             del self.probationary_disappeared[prob_id]
-            del self.probationary_trajectories[prob_id]
+            del self.probationary_cumulative[prob_id]
 
     def promote_probationary(self, prob_id: int) -> int:
         """
@@ -149,21 +274,19 @@ class CentroidTracker:
         if self.probationary_frames[prob_id] < self.min_confirm_frames:
             return False
 
-        # Calculate cumulative path length (distance traveled along trajectory)
-        trajectory = list(self.probationary_trajectories[prob_id])
-        if len(trajectory) < 2:
-            return False
-
-        cumulative_distance = 0.0
-        for i in range(1, len(trajectory)):
-            prev_pos = np.array(trajectory[i-1])
-            curr_pos = np.array(trajectory[i])
-            cumulative_distance += np.linalg.norm(curr_pos - prev_pos)
+        # Cumulative path length is maintained incrementally as segments
+        # arrive, so no per-frame walk over the trajectory is needed
+        cumulative_distance = self.probationary_cumulative[prob_id]
 
-        # Also check net displacement as a secondary validation
+        # Also check net displacement as a secondary validation;
+        # math.hypot on the two scalars skips the NumPy dispatch and
+        # temporary that np.linalg.norm would cost for a 2-vector
         initial_pos = self.probationary_initial[prob_id]
         current_pos = self.probationary[prob_id]
-        net_displacement = np.linalg.norm(current_pos - initial_pos)
+        net_displacement = math.hypot(
+            float(current_pos[0] - initial_pos[0]),
+            float(current_pos[1] - initial_pos[1])
+        )
 
         # Promote if EITHER cumulative path OR net displacement exceeds threshold
         # This catches both straight-line flyers and birds that circle/hover
@@ -191,103 +314,111 @@ class CentroidTracker:
 
         # Phase 1: Handle no detections case
         if len(input_centroids) == 0:
-            # Mark confirmed objects as disappeared
-            for object_id in list(self.disappeared.keys()):
-                self.disappeared[object_id] += 1
-                if self.disappeared[object_id] > self.max_disappeared:
-                    self.deregister(object_id)
+            # Mark confirmed objects as disappeared. Bump counts in a
+            # first pass (no key-list snapshot needed), deregister in a
+            # second using the reusable scratch buffer
+            self._scratch_remove_ids.clear()
+            for object_id, count in self.disappeared.items():
+                self.disappeared[object_id] = count + 1
+                if count + 1 > self.max_disappeared:
+                    self._scratch_remove_ids.append(object_id)
+            for object_id in self._scratch_remove_ids:
+                self.deregister(object_id)
 
             # Mark probationary objects as disappeared (faster cleanup)
-            for prob_id in list(self.probationary_disappeared.keys()):
-                self.probationary_disappeared[prob_id] += 1
-                if self.probationary_disappeared[prob_id] > self.probationary_max_disappeared:
-                    self.deregister_probationary(prob_id)
+            self._scratch_remove_ids.clear()
+            for prob_id, count in self.probationary_disappeared.items():
+                self.probationary_disappeared[prob_id] = count + 1
+                if count + 1 > self.probationary_max_disappeared:
+                    self._scratch_remove_ids.append(prob_id)
+            for prob_id in self._scratch_remove_ids:
+                self.deregister_probationary(prob_id)
 
             return self.objects, detection_indices
 
-        # Phase 2: Match confirmed objects with detections
-        remaining_centroids = input_centroids.copy()
-        used_detection_indices = set()
+        # Phase 2: Match confirmed objects with detections. The detections
+        # are only ever read below, so no defensive copy is needed
+        remaining_centroids = input_centroids
 
-        if len(self.objects) > 0:
-            object_ids = list(self.objects.keys())
-            object_centroids = np.array(list(self.objects.values()))
+        # Boolean mask over detections instead of a Python set of indices
+        used_detections = np.zeros(len(remaining_centroids), dtype=bool)
 
-            distances = self._compute_distance_matrix(object_centroids, remaining_centroids)
-            row_indices, col_indices = linear_sum_assignment(distances)
+        if len(self.objects) > 0:
+            object_ids, accepted_rows, accepted_cols, unmatched_rows = \
+                self._match(self._object_store, remaining_centroids)
 
-            used_rows = set()
+            used_detections[accepted_cols] = True
 
-            for row, col in zip(row_indices, col_indices):
-                if distances[row, col] < self.max_distance:
-                    object_id = object_ids[row]
-                    self.objects[object_id] = remaining_centroids[col]
-                    self.disappeared[object_id] = 0
-                    self.trajectories[object_id].append(tuple(remaining_centroids[col]))
-                    used_rows.add(row)
-                    used_detection_indices.add(col)
-                    # Store detection index for this object
-                    detection_indices[object_id] = col
+            for row, col in zip(accepted_rows, accepted_cols):
+                object_id = object_ids[row]
+                self.objects[object_id] = remaining_centroids[col]
+                self.disappeared[object_id] = 0
+                self.trajectories[object_id].append(remaining_centroids[col])
+                self._trajectory_dirty.add(object_id)
+                # Store detection index for this object
+                detection_indices[object_id] = col
 
             # Handle unmatched confirmed objects
-            unused_rows = set(range(len(object_ids))) - used_rows
-            for row in unused_rows:
+            for row in unmatched_rows:
                 object_id = object_ids[row]
                 self.disappeared[object_id] += 1
                 if self.disappeared[object_id] > self.max_disappeared:
                     self.deregister(object_id)
 
         # Phase 3: Match probationary objects with remaining detections
-        remaining_detection_indices = set(range(len(remaining_centroids))) - used_detection_indices
+        remaining_indices = np.flatnonzero(~used_detections)
 
         # Track which probationary objects were matched
         matched_prob_ids = set()
 
-        if len(self.probationary) > 0 and len(remaining_detection_indices) > 0:
-            prob_ids = list(self.probationary.keys())
-            prob_centroids = np.array(list(self.probationary.values()))
-
-            # Convert to sorted list ONCE to guarantee consistent ordering
-            remaining_indices_list = sorted(remaining_detection_indices)
-            remaining_centroids_subset = remaining_centroids[remaining_indices_list]
-
-            distances = self._compute_distance_matrix(prob_centroids, remaining_centroids_subset)
-            row_indices, col_indices = linear_sum_assignment(distances)
-
-            for row, col in zip(row_indices, col_indices):
-                if distances[row, col] < self.max_distance:
-                    prob_id = prob_ids[row]
-                    actual_detection_idx = remaining_indices_list[col]
-
-                    # Update probationary object
-                    new_centroid = remaining_centroids[actual_detection_idx]
-                    self.probationary[prob_id] = new_centroid
-                    self.probationary_disappeared[prob_id] = 0
-                    self.probationary_frames[prob_id] += 1
-                    self.probationary_trajectories[prob_id].append(tuple(new_centroid))
-
-                    # Check if should be promoted to confirmed
-                    if self.check_probationary_promotion(prob_id):
-                        self.promote_probationary(prob_id)
-                    # Check if failed to move enough after min_confirm_frames
-                    elif self.probationary_frames[prob_id] >= self.min_confirm_frames:
-                        # Failed validation - deregister silently
-                        self.deregister_probationary(prob_id)
+        if len(self.probationary) > 0 and len(remaining_indices) > 0:
+            # flatnonzero already yields ascending detection indices
+            remaining_centroids_subset = remaining_centroids[remaining_indices]
+
+            prob_ids, accepted_rows, accepted_cols, _ = \
+                self._match(self._probationary_store, remaining_centroids_subset)
+            accepted_detection_indices = remaining_indices[accepted_cols]
+
+            used_detections[accepted_detection_indices] = True
+
+            for row, actual_detection_idx in zip(accepted_rows, accepted_detection_indices):
+                prob_id = prob_ids[row]
+
+                # Update probationary object, extending its running path
+                # length by the segment it just travelled
+                new_centroid = remaining_centroids[actual_detection_idx]
+                prev_centroid = self.probationary[prob_id]
+                self.probationary_cumulative[prob_id] += math.hypot(
+                    float(new_centroid[0] - prev_centroid[0]),
+                    float(new_centroid[1] - prev_centroid[1])
+                )
+                self.probationary[prob_id] = new_centroid
+                self.probationary_disappeared[prob_id] = 0
+                self.probationary_frames[prob_id] += 1
+
+                # Check if should be promoted to confirmed
+                if self.check_probationary_promotion(prob_id):
+                    self.promote_probationary(prob_id)
+                # Check if failed to move enough after min_confirm_frames
+                elif self.probationary_frames[prob_id] >= self.min_confirm_frames:
+                    # Failed validation - deregister silently
+                    self.deregister_probationary(prob_id)
 
-                    matched_prob_ids.add(prob_id)
-                    used_detection_indices.add(actual_detection_idx)
+                matched_prob_ids.add(prob_id)
 
         # CRITICAL FIX: Age ALL unmatched probationary objects, not just when detections exist
         # This prevents memory leaks and stale probationary tracks
-        for prob_id in list(self.probationary.keys()):
+        self._scratch_remove_ids.clear()
+        for prob_id, count in self.probationary_disappeared.items():
             if prob_id not in matched_prob_ids:
-                self.probationary_disappeared[prob_id] += 1
-                if self.probationary_disappeared[prob_id] > self.probationary_max_disappeared:
-                    self.deregister_probationary(prob_id)
+                self.probationary_disappeared[prob_id] = count + 1
+                if count + 1 > self.probationary_max_disappeared:
+                    self._scratch_remove_ids.append(prob_id)
+        for prob_id in self._scratch_remove_ids:
+            self.deregister_probationary(prob_id)
 
         # Phase 4: Register new probationary objects for remaining detections
-        final_remaining_indices = set(range(len(remaining_centroids))) - used_detection_indices
-        for idx in final_remaining_indices:
+        for idx in np.flatnonzero(~used_detections):
             self.register_probationary(remaining_centroids[idx])
 
         return self.objects, detection_indices
@@ -307,12 +438,16 @@ class CentroidTracker:
         # Track which detection index corresponds to each tracked object
         detection_indices = {}
 
-        # Case 1: No detections - mark all as disappeared
+        # Case 1: No detections - mark all as disappeared, deregistering
+        # in a second pass so no key-list snapshot is needed
         if len(input_centroids) == 0:
-            for object_id in list(self.disappeared.keys()):
-                self.disappeared[object_id] += 1
-                if self.disappeared[object_id] > self.max_disappeared:
-                    self.deregister(object_id)
+            self._scratch_remove_ids.clear()
+            for object_id, count in self.disappeared.items():
+                self.disappeared[object_id] = count + 1
+                if count + 1 > self.max_disappeared:
+                    self._scratch_remove_ids.append(object_id)
+            for object_id in self._scratch_remove_ids:
+                self.deregister(object_id)
             return self.objects, detection_indices
 
         # Case 2: No existing objects - register all detections
@@ -323,41 +458,94 @@ class CentroidTracker:
             return self.objects, detection_indices
 
         # Case 3: Match existing objects to new detections
-        object_ids = list(self.objects.keys())
-        object_centroids = np.array(list(self.objects.values()))
+        object_ids, accepted_rows, accepted_cols, unmatched_rows = \
+            self._match(self._object_store, input_centroids)
 
-        distances = self._compute_distance_matrix(object_centroids, input_centroids)
-        row_indices, col_indices = linear_sum_assignment(distances)
+        used_cols = np.zeros(len(input_centroids), dtype=bool)
+        used_cols[accepted_cols] = True
 
-        used_rows = set()
-        used_cols = set()
-
-        for row, col in zip(row_indices, col_indices):
-            if distances[row, col] < self.max_distance:
-                object_id = object_ids[row]
-                self.objects[object_id] = input_centroids[col]
-                self.disappeared[object_id] = 0
-                self.trajectories[object_id].append(tuple(input_centroids[col]))
-                used_rows.add(row)
-                used_cols.add(col)
-                # Store detection index for this object
-                detection_indices[object_id] = col
-
-        unused_rows = set(range(len(object_ids))) - used_rows
-        unused_cols = set(range(len(input_centroids))) - used_cols
+        for row, col in zip(accepted_rows, accepted_cols):
+            object_id = object_ids[row]
+            self.objects[object_id] = input_centroids[col]
+            self.disappeared[object_id] = 0
+            self.trajectories[object_id].append(input_centroids[col])
+            self._trajectory_dirty.add(object_id)
+            # Store detection index for this object
+            detection_indices[object_id] = col
 
-        for row in unused_rows:
+        for row in unmatched_rows:
             object_id = object_ids[row]
             self.disappeared[object_id] += 1
             if self.disappeared[object_id] > self.max_disappeared:
                 self.deregister(object_id)
 
-        for col in unused_cols:
+        for col in np.flatnonzero(~used_cols):
             object_id = self.register(input_centroids[col])
             detection_indices[object_id] = col
 
         return self.objects, detection_indices
 
+    def _match(self, store: _CentroidStore, detections: np.ndarray):
+        """
+        Match a centroid store against a set of detections.
+
+        Shared core of both update paths: snapshots the store's row
+        order, solves the assignment on the distance matrix, accepts
+        pairs under max_distance with one vectorized mask, and writes
+        the accepted detections back into the store in place (safe
+        because callers only deregister afterwards).
+
+        Args:
+            store: Centroid store to match from (rows M)
+            detections: (N, 2) detection centroids
+
+        Returns:
+            Tuple of (ids, accepted_rows, accepted_cols, unmatched_rows)
+            where ids is the row-order ID snapshot, accepted_rows/cols
+            index into ids/detections for matched pairs, and
+            unmatched_rows holds the store rows left unmatched
+        """
+        ids = list(store.ids)
+        centroids = store.view()
+
+        distances = self._compute_distance_matrix(centroids, detections)
+        row_indices, col_indices = self._solve_assignment(distances)
+
+        accept = distances[row_indices, col_indices] < self.max_distance
+        accepted_rows = row_indices[accept]
+        accepted_cols = col_indices[accept]
+
+        centroids[accepted_rows] = detections[accepted_cols]
+
+        unmatched = np.ones(len(ids), dtype=bool)
+        unmatched[accepted_rows] = False
+        return ids, accepted_rows, accepted_cols, np.flatnonzero(unmatched)
+
+    @staticmethod
+    def _solve_assignment(distances: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Solve the assignment problem for a cost matrix.
+
+        With a single row or column the Hungarian optimum is just the
+        argmin, so sparse scenes (one tracked object or one detection,
+        the common case) skip the SciPy solver and its setup overhead
+        entirely. Larger problems fall through to linear_sum_assignment.
+
+        Args:
+            distances: (M, N) cost matrix with M, N >= 1
+
+        Returns:
+            (row_indices, col_indices) arrays of matched pairs
+        """
+        m, n = distances.shape
+        if m == 1:
+            return np.zeros(1, dtype=np.intp), np.atleast_1d(distances[0].argmin())
+        if n == 1:
+            return np.atleast_1d(distances[:, 0].argmin()), np.zeros(1, dtype=np.intp)
+        if _linear_sum_assignment is None:
+            _load_scipy()
+        return _linear_sum_assignment(distances)
+
     def _compute_distance_matrix(self, centroids_a: np.ndarray, centroids_b: np.ndarray) -> np.ndarray:
         """
         Compute Euclidean distance matrix between two sets of centroids.
@@ -369,14 +557,19 @@ class CentroidTracker:
         Returns:
             Distance matrix of shape (M, N)
         """
-        # Expand dimensions for broadcasting
-        a_expanded = centroids_a[:, np.newaxis, :]  # (M, 1, 2)
-        b_expanded = centroids_b[np.newaxis, :, :]  # (1, N, 2)
+        # cdist computes the Euclidean matrix in compiled C with no large
+        # Python-level temporary; contiguous float64 inputs avoid its
+        # internal conversion copy
+        if _cdist is None:
+            _load_scipy()
 
-        # Compute Euclidean distances
-        distances = np.linalg.norm(a_expanded - b_expanded, axis=2)
+        a = np.ascontiguousarray(centroids_a, dtype=np.float64)
+        b = np.ascontiguousarray(centroids_b, dtype=np.float64)
 
-        return distances
+        # Keep true Euclidean distances: callers threshold against
+        # max_distance and the Hungarian cost stays a sum of distances,
+        # which squaring would not preserve
+        return _cdist(a, b)
 
     def get_trajectory(self, object_id: int) -> List[Tuple[int, int]]:
         """
@@ -389,9 +582,34 @@ class CentroidTracker:
             List of (cx, cy) tuples representing the path
         """
         if object_id in self.trajectories:
-            return list(self.trajectories[object_id])
+            return [tuple(p) for p in self.trajectories[object_id].points().astype(int)]
         return []
 
+    def get_trajectory_array(self, object_id: int) -> np.ndarray:
+        """
+        Get the trajectory of an object as an int32 ndarray for drawing.
+
+        The array is cached and only rebuilt for objects whose trail changed
+        since the last call, so drawing code can call this every frame
+        without paying a list-to-array conversion per object.
+
+        Args:
+            object_id: ID of object
+
+        Returns:
+            Array of shape (N, 2) with (cx, cy) rows; empty for unknown IDs
+        """
+        if object_id not in self.trajectories:
+            return np.empty((0, 2), dtype=np.int32)
+
+        if object_id in self._trajectory_dirty or object_id not in self._trajectory_arrays:
+            self._trajectory_arrays[object_id] = (
+                self.trajectories[object_id].points().astype(np.int32)
+            )
+            self._trajectory_dirty.discard(object_id)
+
+        return self._trajectory_arrays[object_id]
+
     def get_statistics(self) -> Dict[str, int]:
         """
         Get tracking statistics.
@@ -409,7 +627,10 @@ class CentroidTracker:
         Reset tracker to initial state.
         """
         self.next_object_id = 0
-        self.objects = OrderedDict()
-        self.disappeared = OrderedDict()
+        self.objects = {}
+        self.disappeared = {}
+        self._object_store.clear()
         self.trajectories = {}
+        self._trajectory_arrays = {}
+        self._trajectory_dirty = set()
         self.total_birds_seen = 0
@@ -62,13 +62,23 @@ function setupBirdTrackingHandlers() {
 
       pythonProcess.stdin?.write(startCommand);
 
-      // Handle stdout (JSON messages from Python)
-      pythonProcess.stdout?.on('data', (data) => {
-        const lines = data.toString().split('\n').filter((line: string) => line.trim());
+      // Handle stdout: length-prefixed JSON frames (4-byte LE length + payload).
+      // Frames can span or share 'data' chunks, so accumulate into a buffer.
+      let stdoutBuffer = Buffer.alloc(0);
+      pythonProcess.stdout?.on('data', (data: Buffer) => {
+        stdoutBuffer = stdoutBuffer.length === 0 ? data : Buffer.concat([stdoutBuffer, data]);
+
+        while (stdoutBuffer.length >= 4) {
+          const payloadLength = stdoutBuffer.readUInt32LE(0);
+          if (stdoutBuffer.length < 4 + payloadLength) {
+            break;
+          }
+
+          const payload = stdoutBuffer.subarray(4, 4 + payloadLength);
+          stdoutBuffer = stdoutBuffer.subarray(4 + payloadLength);
 
-        lines.forEach((line: string) => {
           try {
-            const message = JSON.parse(line);
+            const message = JSON.parse(payload.toString());
 
             if (message.type === 'frame_data') {
               mainWindow?.webContents.send('bird-tracking:frame-data', message.data);
@@ -78,9 +88,9 @@ function setupBirdTrackingHandlers() {
               mainWindow?.webContents.send('bird-tracking:error', message.message);
             }
           } catch (e) {
-            console.error('Failed to parse Python output:', line, e);
+            console.error('Failed to parse Python output:', payload.toString(), e);
           }
-        });
+        }
       });
 
       // Handle stderr (errors)